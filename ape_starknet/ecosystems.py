@@ -1,5 +1,6 @@
 from enum import Enum
-from typing import Any, Dict, Iterator, List, Optional, Tuple, Type, Union
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Type, Union
 
 from ape.api import BlockAPI, EcosystemAPI, ReceiptAPI, TransactionAPI
 from ape.api.networks import ProxyInfoAPI
@@ -8,9 +9,9 @@ from ape.types import AddressType, ContractLog, RawAddress
 from ape.utils import EMPTY_BYTES32, to_int
 from eth_utils import is_0x_prefixed
 from ethpm_types import ContractType
-from ethpm_types.abi import ConstructorABI, EventABI, EventABIType, MethodABI
+from ethpm_types.abi import ConstructorABI, EventABI, MethodABI
 from hexbytes import HexBytes
-from pydantic import Field, validator
+from pydantic import Field
 from starknet_py.net.client_models import StarknetBlock as StarknetClientBlock
 from starknet_py.net.models.address import parse_address
 from starknet_py.net.models.chains import StarknetChainId
@@ -52,6 +53,153 @@ NETWORKS = {
 }
 OZ_PROXY_STORAGE_KEY = get_storage_var_address("Proxy_implementation_hash")
 
+_MAX_SERIALIZER_CACHE_SIZE = 512
+# Cache entries keep a reference to the ABI object they were built from so the
+# ``id()``-based keys can never be re-used by new objects.
+_SERIALIZER_CACHE: Dict[Tuple[int, str], Tuple[Any, FunctionCallSerializer]] = {}
+_METHOD_DICT_CACHE: Dict[int, Tuple[Any, Dict]] = {}
+_FULL_ABI_DICT_CACHE: Dict[int, Tuple[Any, List[Dict]]] = {}
+_FLAT_FELT_CACHE: Dict[Tuple[int, str], Tuple[Any, bool]] = {}
+_IDENTIFIER_MANAGER_CACHE: Dict[int, Tuple[Any, Any]] = {}
+_BYTECODE_CACHE: Dict[int, Tuple[Any, bytes]] = {}
+
+# Selectors are deterministic hashes of the name - never compute one twice.
+_get_cached_selector = lru_cache(maxsize=4096)(get_selector_from_name)
+
+# Any value below this bound fits in a felt without the serializer's
+# field-arithmetic adjustments.
+_FELT_UPPER_BOUND = 2**251
+
+
+def _method_dict(abi: Union[ConstructorABI, MethodABI]) -> Dict:
+    cached = _METHOD_DICT_CACHE.get(id(abi))
+    if cached is not None:
+        return cached[1]
+
+    abi_dict = abi.dict()
+    if len(_METHOD_DICT_CACHE) >= _MAX_SERIALIZER_CACHE_SIZE:
+        _METHOD_DICT_CACHE.clear()
+
+    _METHOD_DICT_CACHE[id(abi)] = (abi, abi_dict)
+    return abi_dict
+
+
+def _full_abi_dicts(full_abi: List) -> List[Dict]:
+    cached = _FULL_ABI_DICT_CACHE.get(id(full_abi))
+    if cached is not None:
+        return cached[1]
+
+    abi_dicts = [a.dict() if hasattr(a, "dict") else a for a in full_abi]
+    if len(_FULL_ABI_DICT_CACHE) >= _MAX_SERIALIZER_CACHE_SIZE:
+        _FULL_ABI_DICT_CACHE.clear()
+
+    _FULL_ABI_DICT_CACHE[id(full_abi)] = (full_abi, abi_dicts)
+    return abi_dicts
+
+
+# Exact-type dispatch for the common primitive-encoding cases; sub-classes
+# (e.g. checksummed address strings) fall through to the ``isinstance`` chain.
+_ENCODE_DISPATCH: Dict[type, Callable[[Any], Any]] = {
+    bool: int,
+    int: lambda value: value,
+    str: lambda value: int(value, 16) if is_0x_prefixed(value) else value,
+    HexBytes: lambda value: int(value.hex(), 16),
+}
+
+_RECEIPT_CLASS_MAP: Dict[TransactionType, Type[StarknetReceipt]] = {
+    TransactionType.INVOKE_FUNCTION: InvokeFunctionReceipt,
+    TransactionType.DECLARE: ContractDeclaration,
+    TransactionType.DEPLOY_ACCOUNT: DeployAccountReceipt,
+}
+_TRANSACTION_CLASS_MAP: Dict[TransactionType, Type[StarknetTransaction]] = {
+    TransactionType.INVOKE_FUNCTION: InvokeFunctionTransaction,
+    TransactionType.DECLARE: DeclareTransaction,
+    TransactionType.DEPLOY_ACCOUNT: DeployAccountTransaction,
+}
+
+
+@lru_cache(maxsize=64)
+def _deserialize_contract_class(bytecode: bytes) -> ContractClass:
+    return ContractClass.deserialize(bytecode)
+
+
+@lru_cache(maxsize=64)
+def _compute_class_hash(bytecode: bytes) -> int:
+    return compute_class_hash(_deserialize_contract_class(bytecode))
+
+
+@lru_cache(maxsize=64)
+def _serialize_contract_class(bytecode: bytes) -> bytes:
+    return _deserialize_contract_class(bytecode).serialize()
+
+
+def _get_bytecode_bytes(contract_type: ContractType) -> bytes:
+    """
+    The canonical bytes form of a contract type's deployment bytecode,
+    computed once per contract type.
+    """
+    cached = _BYTECODE_CACHE.get(id(contract_type))
+    if cached is not None:
+        return cached[1]
+
+    code = (
+        (contract_type.deployment_bytecode.bytecode or 0)
+        if contract_type.deployment_bytecode
+        else 0
+    )
+    bytecode = bytes(HexBytes(code))
+    if len(_BYTECODE_CACHE) >= _MAX_SERIALIZER_CACHE_SIZE:
+        _BYTECODE_CACHE.clear()
+
+    _BYTECODE_CACHE[id(contract_type)] = (contract_type, bytecode)
+    return bytecode
+
+
+def _is_flat_felt_abi(abi: Union[ConstructorABI, MethodABI], abi_types_name: str) -> bool:
+    key = (id(abi), abi_types_name)
+    cached = _FLAT_FELT_CACHE.get(key)
+    if cached is not None:
+        return cached[1]
+
+    is_flat = all(str(t.type) == "felt" for t in getattr(abi, abi_types_name))
+    if len(_FLAT_FELT_CACHE) >= _MAX_SERIALIZER_CACHE_SIZE:
+        _FLAT_FELT_CACHE.clear()
+
+    _FLAT_FELT_CACHE[key] = (abi, is_flat)
+    return is_flat
+
+
+def _get_identifier_manager(full_abi: List) -> Any:
+    # The identifier manager is method-independent; share one per contract ABI
+    # across every method's serializer.
+    cached = _IDENTIFIER_MANAGER_CACHE.get(id(full_abi))
+    if cached is not None:
+        return cached[1]
+
+    manager = identifier_manager_from_abi(_full_abi_dicts(full_abi))
+    if len(_IDENTIFIER_MANAGER_CACHE) >= _MAX_SERIALIZER_CACHE_SIZE:
+        _IDENTIFIER_MANAGER_CACHE.clear()
+
+    _IDENTIFIER_MANAGER_CACHE[id(full_abi)] = (full_abi, manager)
+    return manager
+
+
+def _get_function_call_serializer(
+    abi: Union[ConstructorABI, MethodABI], full_abi: List
+) -> FunctionCallSerializer:
+    anchor = abi.contract_type if abi.contract_type is not None else abi
+    key = (id(anchor), getattr(abi, "name", abi.type))
+    cached = _SERIALIZER_CACHE.get(key)
+    if cached is not None:
+        return cached[1]
+
+    serializer = FunctionCallSerializer(_method_dict(abi), _get_identifier_manager(full_abi))
+    if len(_SERIALIZER_CACHE) >= _MAX_SERIALIZER_CACHE_SIZE:
+        _SERIALIZER_CACHE.clear()
+
+    _SERIALIZER_CACHE[key] = (anchor, serializer)
+    return serializer
+
 
 class ProxyType(Enum):
     LEGACY = 0
@@ -71,13 +219,6 @@ class StarknetBlock(BlockAPI):
     hash: Optional[int] = None
     parent_hash: Any = Field(to_int(EMPTY_BYTES32), alias="parentHash")
 
-    @validator("hash", "parent_hash", pre=True)
-    def validate_hexbytes(cls, value):
-        if not isinstance(value, int):
-            return to_int(value)
-
-        return value
-
 
 class Starknet(EcosystemAPI, StarknetBase):
     """
@@ -86,7 +227,9 @@ class Starknet(EcosystemAPI, StarknetBase):
 
     fee_token_symbol: str = STARKNET_FEE_TOKEN_SYMBOL
 
-    proxy_info_cache: Dict[AddressType, Optional[StarknetProxy]] = {}
+    proxy_info_cache: Dict[AddressType, Optional[StarknetProxy]] = Field(default_factory=dict)
+
+    address_int_cache: Dict[AddressType, int] = Field(default_factory=dict)
 
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__}>"
@@ -119,10 +262,13 @@ class Starknet(EcosystemAPI, StarknetBase):
         if not raw_data:
             return raw_data
 
-        full_abi = [
-            a.dict() for a in (abi.contract_type.abi if abi.contract_type is not None else [abi])
-        ]
-        call_serializer = FunctionCallSerializer(abi.dict(), identifier_manager_from_abi(full_abi))
+        # Fast path: a single felt output round-trips through the serializer
+        # unchanged, so skip building it altogether.
+        if len(abi.outputs) == 1 and _is_flat_felt_abi(abi, "outputs"):
+            return self.encode_primitive_value(raw_data[0])
+
+        full_abi = abi.contract_type.abi if abi.contract_type is not None else [abi]
+        call_serializer = _get_function_call_serializer(abi, full_abi)
         raw_data = [self.encode_primitive_value(v) for v in raw_data]
         decoded = call_serializer.to_python(raw_data)
 
@@ -142,29 +288,33 @@ class Starknet(EcosystemAPI, StarknetBase):
         self,
         full_abi: List,
         abi: Union[ConstructorABI, MethodABI],
-        call_args,
+        call_args: Sequence,
     ) -> List:
-        full_abi = [abi.dict() if hasattr(abi, "dict") else abi for abi in full_abi]
-        call_serializer = FunctionCallSerializer(abi.dict(), identifier_manager_from_abi(full_abi))
+        # Fast path: when every input is a plain felt, the serializer would
+        # emit the encoded values as-is - flatten them directly.
+        if len(call_args) == len(abi.inputs) and _is_flat_felt_abi(abi, "inputs"):
+            encoded_args = [self.encode_primitive_value(a) for a in call_args]
+            if all(type(v) is int and 0 <= v < _FELT_UPPER_BOUND for v in encoded_args):
+                return encoded_args
+
+        call_serializer = _get_function_call_serializer(abi, full_abi)
+        inputs = abi.inputs
+        is_array = [str(i.type).endswith("*") for i in inputs]
+        is_len = [i.name is not None and i.name.endswith("_len") for i in inputs]
         pre_encoded_args: List[Any] = []
-        index = 0
-        last_index = min(len(abi.inputs), len(call_args)) - 1
+        last_index = min(len(inputs), len(call_args)) - 1
         did_process_array_during_arr_len = False
 
-        for call_arg, input_type in zip(call_args, abi.inputs):
-            if str(input_type.type).endswith("*"):
+        for index in range(last_index + 1):
+            call_arg = call_args[index]
+            if is_array[index]:
                 if did_process_array_during_arr_len:
                     did_process_array_during_arr_len = False
                     continue
 
                 encoded_arg = self._pre_encode_value(call_arg)
                 pre_encoded_args.append(encoded_arg)
-            elif (
-                input_type.name is not None
-                and input_type.name.endswith("_len")
-                and index < last_index
-                and str(abi.inputs[index + 1].type).endswith("*")
-            ):
+            elif is_len[index] and index < last_index and is_array[index + 1]:
                 pre_encoded_arg = self._pre_encode_value(call_arg)
 
                 if isinstance(pre_encoded_arg, int):
@@ -179,10 +329,10 @@ class Starknet(EcosystemAPI, StarknetBase):
             else:
                 pre_encoded_args.append(self._pre_encode_value(call_arg))
 
-            index += 1
-
         calldata, _ = call_serializer.from_python(*pre_encoded_args)
-        return list(calldata)
+        # ``from_python`` typically hands back a list already - only copy when
+        # it does not.
+        return calldata if isinstance(calldata, list) else list(calldata)
 
     def _pre_encode_value(self, value: Any) -> Any:
         if isinstance(value, dict):
@@ -197,10 +347,22 @@ class Starknet(EcosystemAPI, StarknetBase):
             # Will handle single item structs and felts.
             return self._pre_encode_array([array])
 
-        encoded_array = []
-        for item in array:
-            encoded_value = self._pre_encode_value(item)
-            encoded_array.append(encoded_value)
+        # Walk nested arrays with an explicit stack rather than recursing so
+        # large arrays don't pay a Python function call per element.
+        encode_primitive = self.encode_primitive_value
+        encoded_array: List = []
+        stack = [(array, encoded_array)]
+        while stack:
+            source, destination = stack.pop()
+            for item in source:
+                if isinstance(item, dict):
+                    destination.append(self._pre_encode_struct(item))
+                elif isinstance(item, (list, tuple)):
+                    nested: List = []
+                    destination.append(nested)
+                    stack.append((item, nested))
+                else:
+                    destination.append(encode_primitive(item))
 
         return encoded_array
 
@@ -218,6 +380,16 @@ class Starknet(EcosystemAPI, StarknetBase):
         Args:
             value(Any): The given value to be changed to int.
         """
+        value_type = type(value)
+        if value_type is int:
+            # By far the most common case - skip the dispatch lookup entirely.
+            return value
+
+        handler = _ENCODE_DISPATCH.get(value_type)
+        if handler is not None:
+            return handler(value)
+
+        # Sub-classes of the dispatched types land here.
         if isinstance(value, bool):
             # NOTE: bool must come before int.
             return int(value)
@@ -233,16 +405,22 @@ class Starknet(EcosystemAPI, StarknetBase):
 
         return value
 
+    def encode_primitive_values(self, values: Sequence) -> List[int]:
+        """
+        Encodes each of the given values to int.
+
+        Args:
+            values(Sequence): The values to be changed to int.
+        """
+        return list(map(self.encode_primitive_value, values))
+
     def decode_receipt(self, data: dict) -> ReceiptAPI:
-        txn_type = TransactionType(data["transaction"].type)
-        receipt_cls: Type[StarknetReceipt]
-        if txn_type == TransactionType.INVOKE_FUNCTION:
-            receipt_cls = InvokeFunctionReceipt
-        elif txn_type == TransactionType.DECLARE:
-            receipt_cls = ContractDeclaration
-        elif txn_type == TransactionType.DEPLOY_ACCOUNT:
-            receipt_cls = DeployAccountReceipt
-        else:
+        txn_type = data["transaction"].type
+        if not isinstance(txn_type, TransactionType):
+            txn_type = TransactionType(txn_type)
+
+        receipt_cls = _RECEIPT_CLASS_MAP.get(txn_type)
+        if receipt_cls is None:
             raise StarknetProviderError(f"Unable to handle contract type '{txn_type.value}'.")
 
         receipt = receipt_cls.parse_obj(data)
@@ -252,10 +430,14 @@ class Starknet(EcosystemAPI, StarknetBase):
         return receipt
 
     def decode_block(self, block: StarknetClientBlock) -> BlockAPI:
-        return StarknetBlock(
-            hash=block.block_hash,
+        # The client already hands us typed values, so skip pydantic's
+        # per-field validation machinery via ``construct()``.
+        block_hash = block.block_hash
+        parent_hash = block.parent_block_hash
+        return StarknetBlock.construct(
+            hash=block_hash if isinstance(block_hash, int) else to_int(block_hash),
             number=block.block_number,
-            parentHash=block.parent_block_hash,
+            parent_hash=parent_hash if isinstance(parent_hash, int) else to_int(parent_hash),
             size=len(block.transactions),  # TODO: Figure out size
             timestamp=block.timestamp,
         )
@@ -263,8 +445,7 @@ class Starknet(EcosystemAPI, StarknetBase):
     def encode_deployment(
         self, deployment_bytecode: HexBytes, abi: ConstructorABI, *args, **kwargs
     ) -> TransactionAPI:
-        contract_class = ContractClass.deserialize(deployment_bytecode)
-        class_hash = compute_class_hash(contract_class)
+        class_hash = _compute_class_hash(bytes(deployment_bytecode))
         contract_type = abi.contract_type
         if not contract_type:
             raise StarknetEcosystemError(
@@ -282,8 +463,8 @@ class Starknet(EcosystemAPI, StarknetBase):
         if not contract_type:
             raise ContractTypeNotFoundError(address)
 
-        arguments = list(args)
-        encoded_calldata = self._encode_calldata(contract_type.abi, abi, arguments)
+        # ``_encode_calldata`` only reads its args, so pass the tuple as-is.
+        encoded_calldata = self._encode_calldata(contract_type.abi, abi, args)
         return InvokeFunctionTransaction(
             receiver=address,
             method_abi=abi,
@@ -308,26 +489,19 @@ class Starknet(EcosystemAPI, StarknetBase):
         contract_type = (
             contract.contract_type if isinstance(contract, ContractContainer) else contract
         )
-        code = (
-            (contract_type.deployment_bytecode.bytecode or 0)
-            if contract_type.deployment_bytecode
-            else 0
-        )
-        starknet_contract = ContractClass.deserialize(HexBytes(code))
-        return DeclareTransaction(
-            contract_type=contract_type, data=starknet_contract.serialize(), **kwargs
-        )
+        data = _serialize_contract_class(_get_bytecode_bytes(contract_type))
+        return DeclareTransaction(contract_type=contract_type, data=data, **kwargs)
 
     def create_transaction(self, **kwargs) -> TransactionAPI:
-        txn_type = TransactionType(kwargs.pop("type", kwargs.pop("tx_type", "")))
-        txn_cls: Type[StarknetTransaction]
+        txn_type = kwargs.pop("type", kwargs.pop("tx_type", ""))
+        if not isinstance(txn_type, TransactionType):
+            txn_type = TransactionType(txn_type)
+
+        txn_cls = _TRANSACTION_CLASS_MAP.get(txn_type)
+        if txn_cls is None:
+            raise StarknetProviderError(f"Unable to handle transaction type '{txn_type.value}'.")
+
         invoking = txn_type == TransactionType.INVOKE_FUNCTION
-        if invoking:
-            txn_cls = InvokeFunctionTransaction
-        elif txn_type == TransactionType.DECLARE:
-            txn_cls = DeclareTransaction
-        elif txn_type == TransactionType.DEPLOY_ACCOUNT:
-            txn_cls = DeployAccountTransaction
 
         txn_data: Dict[str, Any] = {**kwargs, "signature": None}
         if "chain_id" not in txn_data and self.network_manager.active_provider:
@@ -345,11 +519,8 @@ class Starknet(EcosystemAPI, StarknetBase):
             if not contract_type:
                 contract_type = self.get_contract_type(contract_address)
 
-            if contract_type:
-                bytecode_obj = contract_type.deployment_bytecode
-                if bytecode_obj:
-                    bytecode = bytecode_obj.bytecode
-                    txn_data["data"] = bytecode
+            if contract_type and contract_type.deployment_bytecode:
+                txn_data["data"] = _get_bytecode_bytes(contract_type)
 
         if not invoking:
             return txn_cls(**txn_data)
@@ -373,8 +544,18 @@ class Starknet(EcosystemAPI, StarknetBase):
             # Transactions in blocks show calldata as flattened hex-strs
             # but elsewhere we expect flattened ints. Convert to ints for
             # consistency and testing purposes.
-            encoded_calldata = [self.encode_primitive_value(v) for v in txn_data["calldata"]]
-            txn_data["calldata"] = encoded_calldata
+            calldata = txn_data["calldata"]
+            if calldata and type(calldata[0]) is str:
+                # Raw block calldata is a uniform list of hex-strs; convert in
+                # a tight comprehension instead of dispatching per element.
+                txn_data["calldata"] = [
+                    int(value, 16)
+                    if type(value) is str and is_0x_prefixed(value)
+                    else self.encode_primitive_value(value)
+                    for value in calldata
+                ]
+            else:
+                txn_data["calldata"] = self.encode_primitive_values(calldata)
 
         if "contract_address" in txn_data:
             txn_data["receiver"] = txn_data.pop("contract_address")
@@ -382,47 +563,57 @@ class Starknet(EcosystemAPI, StarknetBase):
         return txn_cls(**txn_data)
 
     def decode_logs(self, logs: List[Dict], *events: EventABI) -> Iterator["ContractLog"]:
-        events_by_selector = {get_selector_from_name(e.name): e for e in events}
-        log_map = {s: [log for log in logs if s in log["keys"]] for s in events_by_selector}
-
-        def from_uint(low: int, high: int) -> int:
-            return low + (high << 128)
+        events_by_selector = {_get_cached_selector(e.name): e for e in events}
+
+        # Bucket the logs by selector in a single pass rather than scanning
+        # every log once per event.
+        log_map: Dict[int, List[Tuple[int, Dict]]] = {s: [] for s in events_by_selector}
+        for log_index, log in enumerate(logs):
+            for key in log["keys"]:
+                bucket = log_map.get(key)
+                if bucket is not None:
+                    bucket.append((log_index, log))
+                    break
 
         def decode_items(
-            abi_types: List[EventABIType], data: List[int]
+            widths: List[Tuple[int, bool]], data: List[int]
         ) -> List[Union[int, Tuple[int, int]]]:
             decoded: List[Union[int, Tuple[int, int]]] = []
-            iter_data = iter(data)
-            for abi_type in abi_types:
-                if abi_type.type == "Uint256":
+            cursor = 0
+            length = len(data)
+            for width, is_uint256 in widths:
+                if is_uint256:
                     # Uint256 are stored using 2 slots
-                    next_item_1 = next(iter_data, None)
-                    next_item_2 = next(iter_data, None)
-                    if next_item_1 is not None and next_item_2 is not None:
-                        decoded.append(from_uint(next_item_1, next_item_2))
-                else:
-                    next_item = next(iter_data, None)
-                    if next_item:
-                        decoded.append(next_item)
+                    if cursor + 1 < length:
+                        decoded.append(data[cursor] + (data[cursor + 1] << 128))
+                elif cursor < length and data[cursor]:
+                    decoded.append(data[cursor])
+
+                cursor += width
 
             return decoded
 
-        for index, (selector, logs) in enumerate(log_map.items()):
+        for selector, matching_logs in log_map.items():
             abi = events_by_selector[selector]
-            if not logs:
+            if not matching_logs:
                 continue
 
-            for log in logs:
-                event_args = dict(
-                    zip([a.name for a in abi.inputs], decode_items(abi.inputs, log["data"]))
-                )
-                yield ContractLog(
+            # Slot widths and input names only depend on the event type -
+            # compute them once per event.
+            widths = [(2, True) if t.type == "Uint256" else (1, False) for t in abi.inputs]
+            names = tuple(a.name for a in abi.inputs)
+            decode_address = self.decode_address
+            for log_index, log in matching_logs:
+                event_args = dict(zip(names, decode_items(widths, log["data"])))
+                # The field values come straight from the provider and our own
+                # decoders, so skip pydantic validation on this hot path.
+                yield ContractLog.construct(
                     block_hash=log["block_hash"],
                     block_number=log["block_number"],
-                    contract_address=self.decode_address(log["from_address"]),
+                    contract_address=decode_address(log["from_address"]),
                     event_arguments=event_args,
                     event_name=abi.name,
-                    log_index=index,
+                    log_index=log_index,
                     transaction_hash=log["transaction_hash"],
                     transaction_index=0,  # Not available
                 )
@@ -435,6 +626,9 @@ class Starknet(EcosystemAPI, StarknetBase):
     def _get_proxy_info(
         self, address: AddressType, contract_type: ContractType
     ) -> Optional[StarknetProxy]:
+        if address in self.proxy_info_cache:
+            return self.proxy_info_cache[address]
+
         proxy_type: Optional[ProxyType] = None
         target: Optional[int] = None
         instance = self.chain_manager.contracts.instance_at(address, contract_type=contract_type)
@@ -450,7 +644,11 @@ class Starknet(EcosystemAPI, StarknetBase):
 
         # OpenZeppelin proxy check
         elif self.provider.client is not None:
-            address_int = self.encode_address(address)
+            address_int = self.address_int_cache.get(address)
+            if address_int is None:
+                address_int = self.encode_address(address)
+                self.address_int_cache[address] = address_int
+
             target = self.provider.client.get_storage_at_sync(
                 contract_address=address_int, key=OZ_PROXY_STORAGE_KEY
             )
@@ -459,11 +657,13 @@ class Starknet(EcosystemAPI, StarknetBase):
             else:
                 proxy_type = ProxyType.OPEN_ZEPPELIN
 
-        return (
+        proxy_info = (
             StarknetProxy(target=self.decode_address(target), type=proxy_type)
             if target and proxy_type
             else None
         )
+        self.proxy_info_cache[address] = proxy_info
+        return proxy_info
 
     def decode_primitive_value(
         self, value: Any, output_type: Union[str, Tuple, List] = "felt"